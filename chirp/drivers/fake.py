@@ -150,6 +150,13 @@ class FakeKenwoodSerial:
         self._rbuf = self._rbuf[n:]
         return ret
 
+    def read_until(self, expected=b'\n', size=None):
+        end = self._rbuf.find(expected)
+        end = len(self._rbuf) if end < 0 else end + len(expected)
+        if size is not None:
+            end = min(end, size)
+        return self.read(end)
+
 
 # NOTE: This is not complete, it's just enough to do the ident dance with
 # these radios
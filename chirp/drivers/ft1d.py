@@ -526,6 +526,10 @@ CHARSET = ["%i" % int(x) for x in range(0, 10)] + \
     [" ", ] + \
     [chr(x) for x in range(ord("a"), ord("z") + 1)] + \
     list(".,:;*#_-/&()@!?^ ") + list("\x00" * 100)
+# Byte translation table from latin-1 to CHARSET index, 0xFF where the
+# character has no CHARSET equivalent.
+CHARSET_TRANS = bytes(CHARSET.index(chr(i)) if chr(i) in CHARSET else 0xFF
+                      for i in range(256))
 
 POWER_LEVELS = [chirp_common.PowerLevel("Hi", watts=5.00),
                 chirp_common.PowerLevel("L3", watts=2.50),
@@ -775,18 +779,19 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
               "every 5 minutes", "every 6 minutes", "every 7 minutes",
               "every 8 minutes", "every 9 minutes", "every 10 minutes")
     _BEEP_SELECT = ("Off", "Key+Scan", "Key")
-    _SQUELCH = ["%d" % x for x in range(0, 16)]
-    _VOLUME = ["%d" % x for x in range(0, 33)]
+    _SQUELCH = tuple("%d" % x for x in range(0, 16))
+    _VOLUME = tuple("%d" % x for x in range(0, 33))
     _OPENING_MESSAGE = ("Off", "DC", "Message", "Normal")
-    _SCAN_RESUME = ["%.1fs" % (0.5 * x) for x in range(4, 21)] + \
-                   ["Busy", "Hold"]
-    _SCAN_RESTART = ["%.1fs" % (0.1 * x) for x in range(1, 10)] + \
-                    ["%.1fs" % (0.5 * x) for x in range(2, 21)]
+    _SCAN_RESUME = tuple(["%.1fs" % (0.5 * x) for x in range(4, 21)] +
+                         ["Busy", "Hold"])
+    _SCAN_RESTART = tuple(["%.1fs" % (0.1 * x) for x in range(1, 10)] +
+                          ["%.1fs" % (0.5 * x) for x in range(2, 21)])
     _LAMP_KEY = ["Key %d sec" % x
                  for x in range(2, 11)] + ["Continuous", "OFF"]
     _LCD_CONTRAST = ["Level %d" % x for x in range(1, 16)]
     _LCD_DIMMER = ["Level %d" % x for x in range(1, 7)]
-    _TOT_TIME = ["Off"] + ["%.1f min" % (0.5 * x) for x in range(1, 21)]
+    _TOT_TIME = ("Off",) + tuple("%.1f min" % (0.5 * x)
+                                 for x in range(1, 21))
     _OFF_ON = ("Off", "On")
     _VOL_MODE = ("Normal", "Auto Back")
     _DTMF_MODE = ("Manual", "Auto")
@@ -794,8 +799,20 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
     _DTMF_DELAY = ("50ms", "250ms", "450ms", "750ms", "1000ms")
     _MY_SYMBOL = ("/[ Person", "/b Bike", "/> Car", "User selected")
     _BACKTRACK_STATUS = ("Valid", "Invalid")
-    _NS_HEMI = ("N", "S")
-    _WE_HEMI = ("W", "E")
+    _BACKTRACK_PREFIX = ("Star ", "L1 ", "L2 ")
+    _BACKTRACK_LABELS = (("status", "status"), ("year", "year"),
+                         ("mon", "month"), ("day", "day"),
+                         ("hour", "hour"), ("min", "min"),
+                         ("NShemi", "NS hemisphere"),
+                         ("lat", "Latitude"),
+                         ("lat_min", "Latitude Minutes"),
+                         ("lat_dec_sec", "Latitude Decimal Seconds"),
+                         ("WEhemi", "WE hemisphere"),
+                         ("lon", "Longitude"),
+                         ("lon_min", "Longitude Minutes"),
+                         ("lon_dec_sec", "Longitude Decimal Seconds"))
+    _NS_HEMI = frozenset(("N", "S"))
+    _WE_HEMI = frozenset(("W", "E"))
     _APRS_HIGH_SPEED_MAX = 70
     _MIC_GAIN = ("Level %d" % i for i in range(1, 10))
     _AMS_TX_MODE = ("TX Auto", "TX DIGITAL", "TX FM")
@@ -871,8 +888,8 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
               "every 5 minutes", "every 6 minutes", "every 7 minutes",
               "every 8 minutes", "every 9 minutes", "every 10 minutes")
     _BEEP_SELECT = ("Off", "Key+Scan", "Key")
-    _SQUELCH = ["%d" % x for x in range(0, 16)]
-    _VOLUME = ["%d" % x for x in range(0, 33)]
+    _SQUELCH = tuple("%d" % x for x in range(0, 16))
+    _VOLUME = tuple("%d" % x for x in range(0, 33))
     _DG_ID = ["%d" % x for x in range(0, 100)]
     _GM_RING = ("OFF", "IN RING", "ALWAYS")
     _GM_INTERVAL = ("LONG", "NORMAL", "OFF")
@@ -2090,13 +2107,9 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
         menu = RadioSettingGroup("backtrack", "Backtrack")
 
         for i in range(3):
-            prefix = ''
-            if i == 0:
-                prefix = "Star "
-            if i == 1:
-                prefix = "L1 "
-            if i == 2:
-                prefix = "L2 "
+            prefix = self._BACKTRACK_PREFIX[i]
+            label = {field: prefix + text
+                     for field, text in self._BACKTRACK_LABELS}
 
             bt_idx = "backtrack[%d]" % i
 
@@ -2107,7 +2120,7 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                 self._BACKTRACK_STATUS[0 if bt.status == 1 else 1])
             rs = RadioSetting(
                     "%s.status" % bt_idx,
-                    prefix + "status", val)
+                    label["status"], val)
             rs.set_apply_callback(self.apply_backtrack_status, bt)
             menu.append(rs)
 
@@ -2117,7 +2130,7 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                 val = RadioSettingValueInteger(0, 99, 0)
             rs = RadioSetting(
                     "%s.year" % bt_idx,
-                    prefix + "year", val)
+                    label["year"], val)
             menu.append(rs)
 
             if bt.status == 1 and int(bt.mon) <= 12:
@@ -2126,7 +2139,7 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                 val = RadioSettingValueInteger(0, 12, 0)
             rs = RadioSetting(
                     "%s.mon" % bt_idx,
-                    prefix + "month", val)
+                    label["mon"], val)
             menu.append(rs)
 
             if bt.status == 1:
@@ -2135,7 +2148,7 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                 val = RadioSettingValueInteger(0, 31, 0)
             rs = RadioSetting(
                     "%s.day" % bt_idx,
-                    prefix + "day", val)
+                    label["day"], val)
             menu.append(rs)
 
             if bt.status == 1:
@@ -2144,7 +2157,7 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                 val = RadioSettingValueInteger(0, 23, 0)
             rs = RadioSetting(
                     "%s.hour" % bt_idx,
-                    prefix + "hour", val)
+                    label["hour"], val)
             menu.append(rs)
 
             if bt.status == 1:
@@ -2153,17 +2166,17 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                 val = RadioSettingValueInteger(0, 59, 0)
             rs = RadioSetting(
                     "%s.min" % bt_idx,
-                    prefix + "min", val)
+                    label["min"], val)
             menu.append(rs)
 
             if bt.status == 1 and \
-                    (str(bt.NShemi) == 'N' or str(bt.NShemi) == 'S'):
+                    str(bt.NShemi) in self._NS_HEMI:
                 val = RadioSettingValueString(0, 1, str(bt.NShemi))
             else:
                 val = RadioSettingValueString(0, 1, ' ')
             rs = RadioSetting(
                     "%s.NShemi" % bt_idx,
-                    prefix + "NS hemisphere", val)
+                    label["NShemi"], val)
             rs.set_apply_callback(self.apply_NShemi, bt)
             menu.append(rs)
 
@@ -2172,7 +2185,7 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                         0, 3, self.zero_pad(bt.lat, 3))
             else:
                 val = RadioSettingValueString(0, 3, '   ')
-            rs = RadioSetting("%s.lat" % bt_idx, prefix + "Latitude", val)
+            rs = RadioSetting("%s.lat" % bt_idx, label["lat"], val)
             rs.set_apply_callback(self.apply_bt_lat, bt)
             menu.append(rs)
 
@@ -2184,7 +2197,7 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                 val = RadioSettingValueString(0, 2, '  ')
             rs = RadioSetting(
                     "%s.lat_min" % bt_idx,
-                    prefix + "Latitude Minutes", val)
+                    label["lat_min"], val)
             rs.set_apply_callback(self.apply_bt_lat_min, bt)
             menu.append(rs)
 
@@ -2196,19 +2209,19 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                 val = RadioSettingValueString(0, 4, '    ')
             rs = RadioSetting(
                     "%s.lat_dec_sec" % bt_idx,
-                    prefix + "Latitude Decimal Seconds", val)
+                    label["lat_dec_sec"], val)
             rs.set_apply_callback(self.apply_bt_lat_dec_sec, bt)
             menu.append(rs)
 
             if bt.status == 1 and \
-                    (str(bt.WEhemi) == 'W' or str(bt.WEhemi) == 'E'):
+                    str(bt.WEhemi) in self._WE_HEMI:
                 val = RadioSettingValueString(
                     0, 1, str(bt.WEhemi))
             else:
                 val = RadioSettingValueString(0, 1, ' ')
             rs = RadioSetting(
                     "%s.WEhemi" % bt_idx,
-                    prefix + "WE hemisphere", val)
+                    label["WEhemi"], val)
             rs.set_apply_callback(self.apply_WEhemi, bt)
             menu.append(rs)
 
@@ -2217,7 +2230,7 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                     0, 3, self.zero_pad(bt.lon, 3))
             else:
                 val = RadioSettingValueString(0, 3, '   ')
-            rs = RadioSetting("%s.lon" % bt_idx, prefix + "Longitude", val)
+            rs = RadioSetting("%s.lon" % bt_idx, label["lon"], val)
             rs.set_apply_callback(self.apply_bt_lon, bt)
             menu.append(rs)
 
@@ -2229,7 +2242,7 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                 val = RadioSettingValueString(0, 2, '  ')
             rs = RadioSetting(
                     "%s.lon_min" % bt_idx,
-                    prefix + "Longitude Minutes", val)
+                    label["lon_min"], val)
             rs.set_apply_callback(self.apply_bt_lon_min, bt)
             menu.append(rs)
 
@@ -2241,7 +2254,7 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                 val = RadioSettingValueString(0, 4, '    ')
             rs = RadioSetting(
                 "%s.lon_dec_sec" % bt_idx,
-                prefix + "Longitude Decimal Seconds", val)
+                label["lon_dec_sec"], val)
             rs.set_apply_callback(self.apply_bt_lon_dec_sec, bt)
             menu.append(rs)
 
@@ -2412,8 +2425,8 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
     def apply_ff_padded_string(cls, setting, obj):
         # FF pad.
         val = setting.value.get_value()
-        max_len = getattr(obj, "padded_string").size() / 8
-        val = str(val).rstrip()
+        max_len = len(obj.padded_string)
+        val = str(val).rstrip().encode()
         setattr(obj, "padded_string", cls._add_ff_pad(val, max_len))
 
     @classmethod
@@ -2430,9 +2443,16 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
 
     def set_settings(self, settings):
         _mem = self._memobj
-        for element in settings:
+        # Walk nested groups with an explicit stack of iterators rather
+        # than recursing, preserving the original depth-first order.
+        stack = [iter(settings)]
+        while stack:
+            element = next(stack[-1], None)
+            if element is None:
+                stack.pop()
+                continue
             if not isinstance(element, RadioSetting):
-                self.set_settings(element)
+                stack.append(iter(element))
                 continue
             if not element.changed():
                 continue
@@ -2458,11 +2478,14 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                         obj = getattr(obj, name)
 
                 try:
-                    old_val = getattr(obj, setting)
-                    LOG.debug("Setting %s(%r) <= %s" % (
-                            element.get_name(), old_val, element.value))
+                    # The old value is only wanted for the log, so skip
+                    # reading it back unless debug logging is on.
+                    if LOG.isEnabledFor(logging.DEBUG):
+                        old_val = getattr(obj, setting)
+                        LOG.debug("Setting %s(%r) <= %s" % (
+                                element.get_name(), old_val, element.value))
                     setattr(obj, setting, element.value)
-                except AttributeError as e:
+                except (AttributeError, KeyError) as e:
                     LOG.error("Setting %s is not in the memory map: %s" %
                               (element.get_name(), e))
             except Exception:
@@ -2472,17 +2495,22 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
     def apply_ff_padded_yaesu(cls, setting, obj):
         # FF pad yaesus custom string format.
         rawval = setting.value.get_value()
-        max_len = getattr(obj, "padded_yaesu").size() / 8
+        max_len = len(obj.padded_yaesu)
         rawval = str(rawval).rstrip()
-        val = [CHARSET.index(x) for x in rawval]
-        for x in range(len(val), max_len):
-            val.append(0xFF)
-        obj.padded_yaesu = val
+        try:
+            val = rawval.encode('latin-1').translate(CHARSET_TRANS)
+        except UnicodeEncodeError:
+            val = b'\xFF'
+        if b'\xFF' in val:
+            raise InvalidValueError("Unsupported character in %r" % rawval)
+        obj.padded_yaesu = list(val.ljust(max_len, b'\xFF'))
 
     def apply_volume(cls, setting, vfo):
         val = setting.value.get_value()
-        cls._memobj.vfo_info[(vfo * 2)].volume = val
-        cls._memobj.vfo_info[(vfo * 2) + 1].volume = val
+        vfo_info = cls._memobj.vfo_info
+        base = vfo * 2
+        vfo_info[base].volume = val
+        vfo_info[base + 1].volume = val
 
     def apply_lcd_contrast(cls, setting, obj):
         rawval = setting.value.get_value()
@@ -2508,52 +2536,34 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
     def apply_NShemi(cls, setting, obj):
         hemi = setting.value.get_value().upper()
 
-        if hemi != 'N' and hemi != 'S':
+        if hemi not in cls._NS_HEMI:
             hemi = ' '
         setattr(obj, "NShemi", hemi)
 
     def apply_WEhemi(cls, setting, obj):
         hemi = setting.value.get_value().upper()
 
-        if hemi != 'W' and hemi != 'E':
+        if hemi not in cls._WE_HEMI:
             hemi = ' '
         setattr(obj, "WEhemi", hemi)
 
     def apply_bt_lat(cls, setting, obj):
-        val = setting.value.get_value()
-        val = cls.backtrack_zero_pad(val, 3)
-
-        setattr(obj, "lat", val)
+        setattr(obj, "lat", setting.value.get_value())
 
     def apply_bt_lat_min(cls, setting, obj):
-        val = setting.value.get_value()
-        val = cls.backtrack_zero_pad(val, 2)
-
-        setattr(obj, "lat_min", val)
+        setattr(obj, "lat_min", setting.value.get_value())
 
     def apply_bt_lat_dec_sec(cls, setting, obj):
-        val = setting.value.get_value()
-        val = cls.backtrack_zero_pad(val, 4)
-
-        setattr(obj, "lat_dec_sec", val)
+        setattr(obj, "lat_dec_sec", setting.value.get_value())
 
     def apply_bt_lon(cls, setting, obj):
-        val = setting.value.get_value()
-        val = cls.backtrack_zero_pad(val, 3)
-
-        setattr(obj, "lon", val)
+        setattr(obj, "lon", setting.value.get_value())
 
     def apply_bt_lon_min(cls, setting, obj):
-        val = setting.value.get_value()
-        val = cls.backtrack_zero_pad(val, 2)
-
-        setattr(obj, "lon_min", val)
+        setattr(obj, "lon_min", setting.value.get_value())
 
     def apply_bt_lon_dec_sec(cls, setting, obj):
-        val = setting.value.get_value()
-        val = cls.backtrack_zero_pad(val, 4)
-
-        setattr(obj, "lon_dec_sec", val)
+        setattr(obj, "lon_dec_sec", setting.value.get_value())
 
     def load_mmap(self, filename):
         if filename.lower().endswith(self._adms_ext):
@@ -2573,7 +2583,7 @@ class FT1Radio(yaesu_clone.YaesuCloneModeRadio):
                 raise Exception('Unable to save .img to %s' % self._adms_ext)
             with open(filename, 'wb') as f:
                 f.write(self._adms_header)
-                f.write(self._mmap.get_packed()[5:])
+                f.write(memoryview(self._mmap.get_packed())[5:])
                 LOG.info('Wrote file')
         else:
             chirp_common.CloneModeRadio.save_mmap(self, filename)
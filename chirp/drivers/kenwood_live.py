@@ -55,7 +55,6 @@ RADIO_IDS = {
 }
 
 LOCK = threading.Lock()
-COMMAND_RESP_BUFSIZE = 8
 LAST_BAUD = 4800
 LAST_DELIMITER = ("\r", " ")
 
@@ -67,7 +66,7 @@ LAST_DELIMITER = ("\r", " ")
 
 def _command(ser, cmd, *args):
     """Send @cmd to radio via @ser"""
-    global LOCK, LAST_DELIMITER, COMMAND_RESP_BUFSIZE
+    global LOCK, LAST_DELIMITER
 
     start = time.time()
 
@@ -77,18 +76,23 @@ def _command(ser, cmd, *args):
         cmd += LAST_DELIMITER[1] + LAST_DELIMITER[1].join(args)
     cmd += LAST_DELIMITER[0]
 
-    LOG.debug("PC->RADIO: %s" % cmd.strip())
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug("PC->RADIO: %s", cmd.strip())
     ser.write(cmd.encode('cp1252'))
 
-    result = ""
-    while not result.endswith(LAST_DELIMITER[0]):
-        result += ser.read(COMMAND_RESP_BUFSIZE).decode('cp1252')
+    # Accumulate raw bytes and decode once the response is complete
+    delimiter = LAST_DELIMITER[0].encode('cp1252')
+    result = bytearray()
+    while not result.endswith(delimiter):
+        result += ser.read_until(delimiter)
         if (time.time() - start) > 1:  # TXH sometimes takes longer on TH-D7G
             LOG.error("Timeout waiting for data")
             break
+    result = result.decode('cp1252')
 
     if result.endswith(LAST_DELIMITER[0]):
-        LOG.debug("RADIO->PC: %r" % result.strip())
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("RADIO->PC: %r", result.strip())
         result = result[:-1]
     else:
         LOG.error("Giving up")
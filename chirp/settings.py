@@ -225,7 +225,11 @@ class RadioSettingValueList(RadioSettingValue):
 
     def __init__(self, options, current=None, current_index=0):
         RadioSettingValue.__init__(self)
-        self._options = list(options)
+        # Tuples are immutable, so share them instead of copying
+        if isinstance(options, tuple):
+            self._options = options
+        else:
+            self._options = list(options)
         self.queue_current(current if current is not None
                            else int(current_index))
 
@@ -66,6 +66,38 @@ class ChirpBankIndexColumn(memedit.ChirpMemoryColumn):
         return wx.grid.GridCellNumberEditor(lower, upper)
 
 
+class ChirpBankGridTable(wx.grid.GridTableBase):
+    """Answer grid cells on demand from the bank editor's caches.
+
+    This keeps wx from storing a string for every memory and bank cell,
+    and means only the cells actually drawn are ever computed.
+    """
+    def __init__(self, editor):
+        super().__init__()
+        self._editor = editor
+
+    def GetNumberRows(self):
+        lower, upper = self._editor._features.memory_bounds
+        return upper - lower + 1
+
+    def GetNumberCols(self):
+        return len(self._editor._col_defs)
+
+    def GetRowLabelValue(self, row):
+        return '%i' % self._editor.row2mem(row)
+
+    def GetColLabelValue(self, col):
+        return self._editor._col_defs[col].label
+
+    def GetValue(self, row, col):
+        return self._editor.get_cell_value(row, col)
+
+    def SetValue(self, row, col, value):
+        # Edits are applied to the radio by the editor's event handlers
+        # and read back from its caches, so there is nothing to store.
+        pass
+
+
 class ChirpBankEdit(common.ChirpEditor):
     def __init__(self, radio, *a, **k):
         super(ChirpBankEdit, self).__init__(*a, **k)
@@ -73,13 +105,17 @@ class ChirpBankEdit(common.ChirpEditor):
         self._radio = radio
         self._features = radio.get_features()
         self._bankmodel = radio.get_bank_model()
+        self._lower = self._features.memory_bounds[0]
 
         self._col_defs = self._setup_columns()
 
+        # One (memory, bank membership, bank index) entry per row
+        lower, upper = self._features.memory_bounds
+        self._memory_cache = [None] * (upper - lower + 1)
+
         self._grid = memedit.ChirpMemoryGrid(self)
-        self._grid.CreateGrid(
-            self._features.memory_bounds[1] - self._features.memory_bounds[0] +
-            1, len(self._col_defs))
+        self._table = ChirpBankGridTable(self)
+        self._grid.SetTable(self._table, takeOwnership=True)
         # GridSelectNone only available in >=4.2.0
         if hasattr(wx.grid.Grid, 'GridSelectNone'):
             self._grid.SetSelectionMode(wx.grid.Grid.GridSelectNone)
@@ -95,55 +131,95 @@ class ChirpBankEdit(common.ChirpEditor):
                                    style=wx.FONTSTYLE_NORMAL,
                                    weight=wx.FONTWEIGHT_NORMAL)
         self._variable_font = self._grid.GetDefaultCellFont()
+
+        def enlarge(font):
+            font = wx.Font(font)
+            font.SetPointSize(font.PointSize + 2)
+            return font
+
+        # Keyed by the (fixed, large) font preferences
+        self._fonts = {
+            (False, False): self._variable_font,
+            (True, False): self._fixed_font,
+            (False, True): enlarge(self._variable_font),
+            (True, True): enlarge(self._fixed_font),
+        }
         self.update_font(False)
 
+        toggle_attr = None
         for col, col_def in enumerate(self._col_defs):
-            self._grid.SetColLabelValue(col, col_def.label)
+            is_toggle = isinstance(col_def, ChirpBankToggleColumn)
+            if is_toggle and toggle_attr is not None:
+                # All the bank columns share one attr (and thus one editor
+                # and renderer). The grid drops a reference for each column
+                # it is set on, so take one per extra column.
+                toggle_attr.IncRef()
+                self._grid.SetColAttr(col, toggle_attr)
+                continue
             attr = wx.grid.GridCellAttr()
             if platform.system() != 'Linux':
                 attr.SetEditor(col_def.get_editor())
                 attr.SetRenderer(col_def.get_renderer())
-            attr.SetReadOnly(not (isinstance(col_def, ChirpBankToggleColumn) or
+            attr.SetReadOnly(not (is_toggle or
                                   isinstance(col_def, ChirpBankIndexColumn)))
             attr.SetAlignment(wx.ALIGN_CENTER, wx.ALIGN_CENTER)
             self._grid.SetColAttr(col, attr)
-
-        self._memory_cache = {}
+            if is_toggle:
+                toggle_attr = attr
 
         self._grid.Bind(wx.grid.EVT_GRID_CELL_CHANGING, self._index_changed)
         self._grid.Bind(wx.grid.EVT_GRID_CELL_LEFT_CLICK, self._memory_changed)
         self._grid.Bind(wx.grid.EVT_GRID_LABEL_LEFT_DCLICK, self._label_click)
+        self._last_hover_col = None
+        self._autosize_pending = False
+        self._autosize_rows = False
         self._grid.GetGridColLabelWindow().Bind(wx.EVT_MOTION,
                                                 self._colheader_mouseover)
 
     def update_font(self, refresh=True):
         fixed = CONF.get_bool('font_fixed', 'state', False)
         large = CONF.get_bool('font_large', 'state', False)
-        if fixed:
-            font = self._fixed_font
-        else:
-            font = self._variable_font
-        if large:
-            font = wx.Font(font)
-            font.SetPointSize(font.PointSize + 2)
-        self._grid.SetDefaultCellFont(font)
+        self._grid.SetDefaultCellFont(self._fonts[(fixed, large)])
         if refresh:
             self.refresh()
-            wx.CallAfter(self._grid.AutoSizeColumns, setAsMin=False)
-            wx.CallAfter(self._grid.AutoSizeRows, setAsMin=False)
+            self._schedule_autosize(rows=True)
+
+    def _schedule_autosize(self, rows=False):
+        """Autosize the grid once control returns to the event loop
+
+        Any number of calls before then result in a single pass over the
+        grid, which also sizes the rows if any of the callers asked.
+        """
+        self._autosize_rows = self._autosize_rows or rows
+        if not self._autosize_pending:
+            self._autosize_pending = True
+            wx.CallAfter(self._do_autosize)
+
+    def _do_autosize(self):
+        rows = self._autosize_rows
+        self._autosize_pending = self._autosize_rows = False
+        self._grid.AutoSizeColumns(setAsMin=True)
+        if rows:
+            self._grid.AutoSizeRows(setAsMin=False)
 
     def selected(self):
         self.refresh_memories()
 
     def refresh_memories(self):
-        self._memory_cache = {}
         lower, upper = self._features.memory_bounds
+        self._memory_cache = [None] * (upper - lower + 1)
 
-        for i in range(lower, upper + 1):
-            mem = self._radio.get_memory(i)
-            self._refresh_memory(mem)
+        # Hold off repainting until everything is loaded; ending the
+        # batch repaints the grid once
+        self._grid.BeginBatch()
+        try:
+            for i in range(lower, upper + 1):
+                mem = self._radio.get_memory(i)
+                self._refresh_memory(mem)
+        finally:
+            self._grid.EndBatch()
 
-        wx.CallAfter(self._grid.AutoSizeColumns, setAsMin=True)
+        self._schedule_autosize()
 
     def _setup_columns(self):
         defs = [
@@ -158,9 +234,11 @@ class ChirpBankEdit(common.ChirpEditor):
 
         self._bank_indexes = {}
         self._bank_index_order = []
+        self._banks = []
         for bank in self._bankmodel.get_mappings():
             self._bank_index_order.append(bank.get_index())
             self._bank_indexes[bank.get_index()] = bank
+            self._banks.append(bank)
             defs.append(ChirpBankToggleColumn(bank, self._radio))
 
         return defs
@@ -174,18 +252,21 @@ class ChirpBankEdit(common.ChirpEditor):
         return bank + self._meta_cols
 
     def row2mem(self, row):
-        return row + self._features.memory_bounds[0]
+        return row + self._lower
 
     def mem2row(self, mem):
-        return mem - self._features.memory_bounds[0]
+        return mem - self._lower
 
     def _colheader_mouseover(self, event):
         x = event.GetX()
         y = event.GetY()
         col = self._grid.XToCol(x, y)
+        if col == self._last_hover_col:
+            return
+        self._last_hover_col = col
         tip = ''
         if col >= self._meta_cols:
-            bank = self._bankmodel.get_mappings()[self.col2bank(col)]
+            bank = self._banks[self.col2bank(col)]
             if hasattr(bank, 'set_name'):
                 tip = _('Double-click to change bank name')
         self._grid.GetGridColLabelWindow().SetToolTip(tip)
@@ -196,7 +277,7 @@ class ChirpBankEdit(common.ChirpEditor):
         if row != -1:
             # Row labels do not change
             return
-        bank = self._bankmodel.get_mappings()[self.col2bank(col)]
+        bank = self._banks[self.col2bank(col)]
         if not hasattr(bank, 'set_name'):
             return
         d = wx.TextEntryDialog(self,
@@ -210,10 +291,13 @@ class ChirpBankEdit(common.ChirpEditor):
 
     def change_bank_name(self, col, bank, name):
         bank.set_name(name)
-        # Refresh the column from the col def to make sure it stuck
-        col_def = self._col_defs[col]
-        self._grid.SetColLabelValue(col, col_def.label)
-        wx.CallAfter(self._grid.AutoSizeColumns, setAsMin=True)
+        # The table reads labels from the col def, so repainting the
+        # header is enough to show whether it stuck
+        self._grid.GetGridColLabelWindow().Refresh()
+        # Only this column's label changed, so only it needs resizing,
+        # unless the whole grid is going to be autosized anyway
+        if not self._autosize_pending:
+            wx.CallAfter(self._grid.AutoSizeColumn, col, setAsMin=True)
 
     @common.error_proof()
     def _index_changed(self, event):
@@ -224,17 +308,18 @@ class ChirpBankEdit(common.ChirpEditor):
             self._change_memory_index(self.row2mem(row), int(value))
 
     def _change_memory_index(self, number, index):
-        for i, bank_index in enumerate(self._bank_index_order):
-            if self._grid.GetCellValue(self.mem2row(number),
-                                       self.bank2col(i)) == BANK_SET_VALUE:
+        mem, member, _bank_index = self._memory_cache[self.mem2row(number)]
+        for bank_index in self._bank_index_order:
+            if bank_index in member:
                 member_bank = self._bank_indexes[bank_index]
                 break
         else:
             raise Exception(_('Memory must be in a bank to be edited'))
 
-        self._bankmodel.set_memory_index(self._memory_cache[number],
-                                         member_bank,
-                                         index)
+        self._bankmodel.set_memory_index(mem, member_bank, index)
+        # The grid does not store the edited value, so re-read it
+        self._refresh_memory(mem)
+        self._refresh_view()
 
         wx.PostEvent(self, common.EditorChanged(self.GetId()))
 
@@ -254,7 +339,7 @@ class ChirpBankEdit(common.ChirpEditor):
                                         value != BANK_SET_VALUE)
 
     def _change_memory_mapping(self, number, bank, present):
-        mem = self._memory_cache[number]
+        mem = self._memory_cache[self.mem2row(number)][0]
         bank = self._bank_indexes[self._bank_index_order[bank]]
         if present:
             self._bankmodel.add_memory_to_mapping(mem, bank)
@@ -262,43 +347,58 @@ class ChirpBankEdit(common.ChirpEditor):
             self._bankmodel.remove_memory_from_mapping(mem, bank)
 
         self._refresh_memory(mem)
+        self._refresh_view()
 
         wx.PostEvent(self, common.EditorChanged(self.GetId()))
 
+    def _refresh_view(self):
+        """Have the grid repaint the visible cells from the table"""
+        self._grid.ForceRefresh()
+
     @common.error_proof()
     def _refresh_memory(self, mem):
-        self._memory_cache[mem.number] = mem
-        self._grid.SetRowLabelValue(self.mem2row(mem.number),
-                                    '%i' % mem.number)
+        row = self.mem2row(mem.number)
+        if mem.empty:
+            # Empty memories are shown blank, so don't bother asking the
+            # bank model about them
+            self._memory_cache[row] = (mem, frozenset(), None)
+            return
 
         bank_index = None
-        member = [bank.get_index()
-                  for bank in self._bankmodel.get_memory_mappings(mem)]
-        for i, bank in enumerate(self._bank_indexes.values()):
-            present = bank.get_index() in member and not mem.empty
-            self._grid.SetCellValue(self.mem2row(mem.number),
-                                    self.bank2col(i),
-                                    present and BANK_SET_VALUE or '')
-            if present and isinstance(self._bankmodel,
-                                      chirp_common.MappingModelIndexInterface):
+        member = {bank.get_index()
+                  for bank in self._bankmodel.get_memory_mappings(mem)}
+        indexed = isinstance(self._bankmodel,
+                             chirp_common.MappingModelIndexInterface)
+        for bank in self._banks:
+            if bank.get_index() in member and indexed:
                 # NOTE: if this is somehow an indexed many-to-one model,
                 # we will only get the last index!
                 bank_index = self._bankmodel.get_memory_index(mem, bank)
 
-        for i in range(0, self._meta_cols):
-            meta_col = self._col_defs[i]
-            if meta_col.name == 'freq':
-                freq = '' if mem.empty else chirp_common.format_freq(mem.freq)
-                self._grid.SetCellValue(
-                    self.mem2row(mem.number), i, freq)
-            elif meta_col.name == 'name':
-                self._grid.SetCellValue(
-                    self.mem2row(mem.number),
-                    i, '' if mem.empty else mem.name)
-            elif meta_col.name == 'bank_index' and bank_index is not None:
-                self._grid.SetCellValue(
-                    self.mem2row(mem.number),
-                    i, '' if mem.empty else '%i' % bank_index)
+        self._memory_cache[row] = (mem, member, bank_index)
+
+    def get_cell_value(self, row, col):
+        """Compute the text for a grid cell from the cached memory"""
+        cached = self._memory_cache[row]
+        if cached is None:
+            # Not loaded (yet)
+            return ''
+        mem, member, bank_index = cached
+        if mem.empty:
+            return ''
+
+        if col >= self._meta_cols:
+            index = self._bank_index_order[self.col2bank(col)]
+            return BANK_SET_VALUE if index in member else ''
+
+        meta_col = self._col_defs[col]
+        if meta_col.name == 'freq':
+            return chirp_common.format_freq(mem.freq)
+        elif meta_col.name == 'name':
+            return mem.name
+        elif meta_col.name == 'bank_index' and bank_index is not None:
+            return '%i' % bank_index
+        return ''
 
 
 class ChirpBankEditSync(ChirpBankEdit, common.ChirpSyncEditor):
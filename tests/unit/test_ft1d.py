@@ -0,0 +1,56 @@
+import os
+import unittest
+
+from chirp.drivers import ft1d
+from chirp import settings
+
+
+class TestFT1DSettings(unittest.TestCase):
+    def setUp(self):
+        img = os.path.join(os.path.dirname(__file__),
+                           '..', 'images', 'Yaesu_FT-1D_R.img')
+        self.radio = ft1d.FT1Radio(img)
+
+    def _find(self, group, name):
+        for element in group:
+            if isinstance(element, settings.RadioSetting):
+                if element.get_name() == name:
+                    return element
+            else:
+                found = self._find(element, name)
+                if found is not None:
+                    return found
+
+    def _set(self, values):
+        radio_settings = self.radio.get_settings()
+        for name, value in values.items():
+            setting = self._find(radio_settings, name)
+            self.assertIsNotNone(setting, 'No setting %s' % name)
+            setting.value = value
+        self.radio.set_settings(radio_settings)
+
+    def test_apply_backtrack(self):
+        self._set({'backtrack[0].lat': '12',
+                   'backtrack[0].NShemi': 'n'})
+        bt = self.radio._memobj.backtrack[0]
+        self.assertEqual('12 ', str(bt.lat))
+        self.assertEqual('N', str(bt.NShemi))
+
+    def test_apply_ff_padded_string(self):
+        self._set({'aprs.msg_group_0': 'ABC'})
+        msg_group = self.radio._memobj.aprs.msg_group[0]
+        raw = msg_group.padded_string.get_raw()
+        self.assertEqual(b'ABC' + b'\xFF' * 6, raw)
+        setting = self._find(self.radio.get_settings(), 'aprs.msg_group_0')
+        self.assertEqual('ABC', str(setting.value).rstrip())
+
+    def test_apply_ff_padded_yaesu(self):
+        self._set({'opening_message.message.padded_yaesu': 'Hi There'})
+        msg = self.radio._memobj.opening_message.message
+        self.assertEqual([0x11, 0x2D, 0x24, 0x1D, 0x2C, 0x29, 0x36, 0x29] +
+                         [0xFF] * 8,
+                         [int(x) for x in msg.padded_yaesu])
+
+    def test_apply_ff_padded_yaesu_unsupported(self):
+        self.assertRaises(settings.InvalidValueError, self._set,
+                          {'opening_message.message.padded_yaesu': 'Hi~'})
@@ -82,6 +82,19 @@ class TestSettingValues(base.BaseTest):
 
         self.assertRaises(IndexError, value.set_index, 7)
 
+    def test_radio_setting_value_list_shares_tuple(self):
+        opts = ("Abc", "Def", "Ghi")
+        value = settings.RadioSettingValueList(opts, current_index=2)
+        value.initialize()
+        self.assertIs(value.get_options(), opts)
+        self.assertEqual(value.get_value(), "Ghi")
+        self.assertEqual(int(value), 2)
+
+        # Lists are still copied so the caller can't change them under us
+        opts = ["Abc", "Def", "Ghi"]
+        value = settings.RadioSettingValueList(opts)
+        self.assertIsNot(value.get_options(), opts)
+
     def test_radio_setting_value_string(self):
         value = settings.RadioSettingValueString(1, 5, "foo", autopad=False)
         value.initialize()